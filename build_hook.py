@@ -7,7 +7,12 @@ class CustomBuildHook(BuildHookInterface):
         # Otherwise the launcher will not be able to import it...
         # When building the wheel, `hdem` will not be included, so we need to catch this case.
         if not os.path.exists("hdem.py"):
-            shutil.copy("hdem", "hdem.py")
+            try:
+                # Hard link is metadata-only, no bytes copied
+                os.link("hdem", "hdem.py")
+            except OSError:
+                # Cross-filesystem or platforms without hard link support
+                shutil.copy("hdem", "hdem.py")
         return build_data
 
     def finalize(self, _version, _build_data, artifact_path):
@@ -2,28 +2,83 @@
 Pytest configuration and shared fixtures.
 """
 
+import importlib.util
 import os
-import shutil
+import py_compile
+import sys
+from dataclasses import dataclass
+from importlib.machinery import SourceFileLoader
+from typing import Tuple
+
 import pytest
 
 
-# Copy hdem to hdem.py before any tests run
-# This needs to be at the module level, not inside a fixture
-# to ensure it happens before any imports in test files
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 hdem_path = os.path.join(project_root, "hdem")
-hdem_py_path = os.path.join(project_root, "hdem.py")
 
-if not os.path.exists(hdem_py_path) and os.path.exists(hdem_path):
-    shutil.copy2(hdem_path, hdem_py_path)
+# Import the extensionless `hdem` script directly as a module, so no hdem.py
+# shim needs to be created or cleaned up anywhere. This must happen at module
+# level to ensure the module is registered before any imports in test files.
+if "hdem" not in sys.modules:
+    # pytest disables bytecode writing (sys.dont_write_bytecode), so each test
+    # session and each xdist worker would re-parse the whole script. Compile it
+    # into __pycache__ once when stale; the loader still *reads* the cache.
+    cache_path = importlib.util.cache_from_source(hdem_path)
+    if not (os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(hdem_path)):
+        try:
+            py_compile.compile(hdem_path, doraise=True)
+        except (py_compile.PyCompileError, OSError):
+            pass  # fall back to parsing the source directly
+
+    loader = SourceFileLoader("hdem", hdem_path)
+    spec = importlib.util.spec_from_loader("hdem", loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["hdem"] = module
+    loader.exec_module(module)
+
+
+@dataclass(frozen=True, slots=True)
+class FakeRRSet:
+    """Minimal stand-in for a dnspython RRset."""
+
+    ttl: int
+
+
+@dataclass(frozen=True, slots=True)
+class FakeAnswer:
+    """Minimal stand-in for a dnspython Answer: a TTL plus iterable rdatas."""
+
+    rrset: FakeRRSet
+    rdatas: Tuple
+
+    def __iter__(self):
+        return iter(self.rdatas)
+
+
+@dataclass(frozen=True, slots=True)
+class FakeMXRdata:
+    """Minimal stand-in for a dnspython MX rdata."""
+
+    preference: int
+    exchange: str
+
+
+@dataclass(frozen=True, slots=True)
+class FakeTXTRdata:
+    """Minimal stand-in for a dnspython TXT rdata (strings are byte segments)."""
+
+    strings: Tuple
+
+
+@pytest.fixture
+def fake_answer():
+    """Factory fixture building a FakeAnswer from a TTL and rdata values.
 
+    Plain strings work as rdatas for record types compared via str(); MX and TXT
+    checks need FakeMXRdata/FakeTXTRdata instances.
+    """
 
-@pytest.fixture(scope="session", autouse=True)
-def cleanup_after_tests(request):
-    """Clean up the copied hdem.py file after all tests."""
-    yield
+    def _make(ttl, *rdatas):
+        return FakeAnswer(rrset=FakeRRSet(ttl=ttl), rdatas=rdatas)
 
-    # Clean up the temporary file only if coverage is not being measured
-    # This ensures the file remains available for coverage reporting
-    if os.path.exists(hdem_py_path) and not request.config.getoption("--cov", default=False):
-        os.remove(hdem_py_path)
+    return _make
@@ -4,11 +4,14 @@ Integration tests for DNS record checking.
 These tests use mocking to avoid actual DNS queries.
 """
 
+import asyncio
+
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 
 import click
-from hdem import Record, Zone, check_dns_record, setup_dns_resolver, check_zone_records
+from tests.conftest import FakeMXRdata, FakeTXTRdata
+from hdem import CachedResolver, Record, Zone, check_dns_record, setup_dns_resolver, check_zone_records
 
 
 class TestDNSChecking:
@@ -16,8 +19,9 @@ class TestDNSChecking:
 
     @pytest.fixture
     def mock_resolver(self):
-        """Fixture to create a mock DNS resolver."""
+        """Fixture to create a mock async DNS resolver."""
         resolver = MagicMock()
+        resolver.resolve = AsyncMock()
         return resolver
 
     @pytest.fixture
@@ -27,7 +31,7 @@ class TestDNSChecking:
         ctx.exit = MagicMock()
         return ctx
 
-    @patch("hdem.dns.resolver.Resolver")
+    @patch("hdem.dns.asyncresolver.Resolver")
     def test_setup_dns_resolver(self, mock_resolver_class):
         """Test the setup of a DNS resolver with authoritative nameservers."""
         # Mock the resolver instance
@@ -55,82 +59,64 @@ class TestDNSChecking:
             raise Exception("Unexpected query")
 
         with patch("hdem.dns.resolver.resolve", side_effect=mock_resolve):
+            # Drop memoized resolvers so the patched classes are actually used
+            setup_dns_resolver.cache_clear()
             resolver = setup_dns_resolver("example.com")
 
             # Verify the resolver was created and configured
             assert resolver.nameservers == ["192.0.2.1"]
 
-    def test_check_a_record_match(self, mock_ctx, mock_resolver):
+    def test_check_a_record_match(self, mock_ctx, mock_resolver, fake_answer):
         """Test checking an A record that matches DNS."""
         # Create test record
         record = Record(id="01234567890123456789012345678901", type="A", name="www", value="192.0.2.1")
 
-        # Mock the DNS response
-        mock_answer = MagicMock()
-        mock_answer.rrset.ttl = 3600
-        mock_rdata = MagicMock()
-        mock_rdata.__str__.return_value = "192.0.2.1"
-        mock_answer.__iter__.return_value = [mock_rdata]
-
-        # Configure resolver to return our mock response
-        mock_resolver.resolve.return_value = mock_answer
+        # Configure resolver to return a fake DNS response
+        mock_resolver.resolve.return_value = fake_answer(3600, "192.0.2.1")
 
         # Check the record
-        status, ttl = check_dns_record(mock_ctx, record, "example.com", mock_resolver)
+        status, ttl = asyncio.run(check_dns_record(mock_ctx, record, "example.com", mock_resolver))
 
         # Verify results
         assert status == "match"
         assert ttl == 3600
         mock_resolver.resolve.assert_called_once_with("www.example.com", "A")
 
-    def test_check_a_record_mismatch(self, mock_ctx, mock_resolver):
+    def test_check_a_record_mismatch(self, mock_ctx, mock_resolver, fake_answer):
         """Test checking an A record that doesn't match DNS."""
         # Create test record
         record = Record(id="01234567890123456789012345678901", type="A", name="www", value="192.0.2.1")
 
-        # Mock the DNS response with different IP
-        mock_answer = MagicMock()
-        mock_answer.rrset.ttl = 3600
-        mock_rdata = MagicMock()
-        mock_rdata.__str__.return_value = "192.0.2.2"  # Different IP
-        mock_answer.__iter__.return_value = [mock_rdata]
-
-        # Configure resolver to return our mock response
-        mock_resolver.resolve.return_value = mock_answer
+        # Configure resolver to return a fake response with a different IP
+        mock_resolver.resolve.return_value = fake_answer(3600, "192.0.2.2")
 
         # Check the record
-        status, ttl = check_dns_record(mock_ctx, record, "example.com", mock_resolver)
+        status, ttl = asyncio.run(check_dns_record(mock_ctx, record, "example.com", mock_resolver))
 
         # Verify results
         assert status == "mismatch"
         assert ttl == 3600
         mock_resolver.resolve.assert_called_once_with("www.example.com", "A")
 
-    def test_check_mx_record_match(self, mock_ctx, mock_resolver):
+    def test_check_mx_record_match(self, mock_ctx, mock_resolver, fake_answer):
         """Test checking an MX record that matches DNS."""
         # Create test MX record
         record = Record(id="01234567890123456789012345678901", type="MX", name="@", value="10 mail.example.com.")
 
-        # Mock the DNS response
-        mock_answer = MagicMock()
-        mock_answer.rrset.ttl = 3600
-        mock_rdata = MagicMock()
-        mock_rdata.preference = 10
-        mock_rdata.exchange.__str__.return_value = "mail.example.com."
-        mock_answer.__iter__.return_value = [mock_rdata]
-
-        # Configure resolver to return our mock response
-        mock_resolver.resolve.return_value = mock_answer
+        # Configure resolver to return a fake DNS response
+        mock_resolver.resolve.return_value = fake_answer(
+            3600, FakeMXRdata(preference=10, exchange="mail.example.com.")
+        )
 
         # Check the record
-        status, ttl = check_dns_record(mock_ctx, record, "example.com", mock_resolver)
+        status, ttl = asyncio.run(check_dns_record(mock_ctx, record, "example.com", mock_resolver))
 
         # Verify results
         assert status == "match"
         assert ttl == 3600
         mock_resolver.resolve.assert_called_once_with("example.com", "MX")
 
-    def test_check_txt_record_match(self, mock_ctx, mock_resolver):
+    def test_check_txt_record_match(self, mock_ctx, mock_resolver, fake_answer):
         """Test checking a TXT record that matches DNS."""
         # Create test TXT record
         record = Record(
@@ -140,42 +126,30 @@ class TestDNSChecking:
             value='"v=spf1 include:_spf.example.com ~all"',
         )
 
-        # Mock the DNS response
-        mock_answer = MagicMock()
-        mock_answer.rrset.ttl = 3600
-        mock_rdata = MagicMock()
-        # TXT records are returned as a list of strings
-        mock_rdata.strings = [b"v=spf1 include:_spf.example.com ~all"]
-        mock_answer.__iter__.return_value = [mock_rdata]
-
-        # Configure resolver to return our mock response
-        mock_resolver.resolve.return_value = mock_answer
+        # Configure resolver to return a fake DNS response
+        # TXT records are returned as a list of byte segments
+        mock_resolver.resolve.return_value = fake_answer(
+            3600, FakeTXTRdata(strings=(b"v=spf1 include:_spf.example.com ~all",))
+        )
 
         # Check the record
-        status, ttl = check_dns_record(mock_ctx, record, "example.com", mock_resolver)
+        status, ttl = asyncio.run(check_dns_record(mock_ctx, record, "example.com", mock_resolver))
 
         # Verify results
         assert status == "match"
         assert ttl == 3600
         mock_resolver.resolve.assert_called_once_with("txt.example.com", "TXT")
 
-    def test_check_cname_record_match(self, mock_ctx, mock_resolver):
+    def test_check_cname_record_match(self, mock_ctx, mock_resolver, fake_answer):
         """Test checking a CNAME record that matches DNS."""
         # Create test CNAME record (relative format)
         record = Record(id="01234567890123456789012345678901", type="CNAME", name="alias", value="target")
 
-        # Mock the DNS response
-        mock_answer = MagicMock()
-        mock_answer.rrset.ttl = 3600
-        mock_rdata = MagicMock()
-        mock_rdata.__str__.return_value = "target.example.com."
-        mock_answer.__iter__.return_value = [mock_rdata]
-
-        # Configure resolver to return our mock response
-        mock_resolver.resolve.return_value = mock_answer
+        # Configure resolver to return a fake DNS response
+        mock_resolver.resolve.return_value = fake_answer(3600, "target.example.com.")
 
         # Check the record
-        status, ttl = check_dns_record(mock_ctx, record, "example.com", mock_resolver)
+        status, ttl = asyncio.run(check_dns_record(mock_ctx, record, "example.com", mock_resolver))
 
         # Verify results
         assert status == "match"
@@ -193,7 +167,7 @@ class TestDNSChecking:
         mock_resolver.resolve.side_effect = NXDOMAIN()
 
         # Check the record
-        status, ttl = check_dns_record(mock_ctx, record, "example.com", mock_resolver)
+        status, ttl = asyncio.run(check_dns_record(mock_ctx, record, "example.com", mock_resolver))
 
         # Verify results
         assert status == "missing"
@@ -201,7 +175,7 @@ class TestDNSChecking:
         mock_resolver.resolve.assert_called_once_with("nonexistent.example.com", "A")
 
     @patch("hdem.setup_dns_resolver")
-    @patch("hdem.check_dns_record")
+    @patch("hdem.check_dns_record", new_callable=AsyncMock)
     def test_check_zone_records(self, mock_check_dns_record, mock_setup_resolver, mock_ctx):
         """Test checking all records in a zone."""
         # Mock resolver setup
@@ -247,3 +221,58 @@ class TestDNSChecking:
 
         # SOA records should be skipped
         assert mock_check_dns_record.call_count == 3  # A, MX, TXT (SOA skipped)
+
+
+class TestCachedResolver:
+    """Test the TTL-aware DNS answer cache."""
+
+    def test_duplicate_queries_hit_cache(self, fake_answer):
+        """Test that repeated queries for the same name and type only hit DNS once."""
+        mock_answer = fake_answer(3600, "192.0.2.1")
+
+        underlying = MagicMock()
+        underlying.resolve = AsyncMock(return_value=mock_answer)
+        resolver = CachedResolver(underlying)
+
+        async def run():
+            first = await resolver.resolve("www.example.com", "A")
+            # Different case and trailing dot normalize to the same cache key
+            second = await resolver.resolve("WWW.example.com.", "A")
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        assert first is mock_answer
+        assert second is mock_answer
+        underlying.resolve.assert_called_once_with("www.example.com", "A")
+
+    def test_different_types_are_cached_separately(self, fake_answer):
+        """Test that the same name with different record types queries DNS per type."""
+        underlying = MagicMock()
+        underlying.resolve = AsyncMock(return_value=fake_answer(3600, "192.0.2.1"))
+        resolver = CachedResolver(underlying)
+
+        async def run():
+            await resolver.resolve("www.example.com", "A")
+            await resolver.resolve("www.example.com", "AAAA")
+
+        asyncio.run(run())
+
+        assert underlying.resolve.call_count == 2
+
+    def test_negative_answers_are_cached(self):
+        """Test that NXDOMAIN responses are cached and re-raised."""
+        from dns.resolver import NXDOMAIN
+
+        underlying = MagicMock()
+        underlying.resolve = AsyncMock(side_effect=NXDOMAIN())
+        resolver = CachedResolver(underlying)
+
+        async def run():
+            for _ in range(2):
+                with pytest.raises(NXDOMAIN):
+                    await resolver.resolve("gone.example.com", "A")
+
+        asyncio.run(run())
+
+        underlying.resolve.assert_called_once_with("gone.example.com", "A")
@@ -28,6 +28,14 @@ class TestTxtRecordProcessing:
         # Empty value
         assert process_txt_record_value('""') == '""'
 
+        # Adjacent segments with no whitespace between them are still joined
+        assert process_txt_record_value('"a""b"') == '"ab"'
+
+        # Whitespace-only segment content must not be mistaken for a segment gap
+        assert process_txt_record_value('" "') == '" "'
+        assert process_txt_record_value('" " "a"') == '" a"'
+        assert process_txt_record_value('"  " ""') == '"  "'
+
     def test_no_concat_txt_records(self):
         """Test disabling concatenation (preserve original format)."""
         # When concat=False, values should be preserved as-is
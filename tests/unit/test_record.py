@@ -60,9 +60,9 @@ class TestRecordValidation:
         with pytest.raises(ValueError, match="Invalid record type"):
             Record(id="", type="INVALID", name="test", value="192.168.1.1")
 
-    def test_valid_record_names(self):
-        """Test that valid record names are accepted."""
-        valid_names = [
+    @pytest.mark.parametrize(
+        "name",
+        [
             "@",  # Apex/root of zone
             "test",
             "test-with-hyphens",
@@ -72,15 +72,16 @@ class TestRecordValidation:
             "1starts-with-number",
             "a" * 63,  # Maximum length label
             "_service._tcp",  # Service discovery record
-        ]
-
-        for name in valid_names:
-            record = Record(id="", type="TXT", name=name, value='"test value"')
-            assert record.name == name
+        ],
+    )
+    def test_valid_record_names(self, name):
+        """Test that valid record names are accepted."""
+        record = Record(id="", type="TXT", name=name, value='"test value"')
+        assert record.name == name
 
-    def test_invalid_record_names(self):
-        """Test that invalid record names are rejected."""
-        invalid_names = [
+    @pytest.mark.parametrize(
+        "name",
+        [
             # Non-string name
             123,
             # Empty name (should use @ for root)
@@ -95,91 +96,94 @@ class TestRecordValidation:
             "ends-with-hyphen-",
             # Multiple consecutive hyphens (valid but unusual)
             # "test--double-hyphen"  # Actually valid per DNS specs
-        ]
-
-        for name in invalid_names:
-            with pytest.raises(ValueError):
-                Record(id="", type="TXT", name=name, value='"test value"')  # type: ignore
+        ],
+    )
+    def test_invalid_record_names(self, name):
+        """Test that invalid record names are rejected."""
+        with pytest.raises(ValueError):
+            Record(id="", type="TXT", name=name, value='"test value"')  # type: ignore
 
     def test_invalid_empty_value(self):
         """Test that empty values are rejected."""
         with pytest.raises(ValueError, match="Record value cannot be empty"):
             Record(id="", type="A", name="test", value="")
 
-    def test_a_record_validation(self):
+    @pytest.mark.parametrize("ip", ["192.168.1.1", "127.0.0.1", "0.0.0.0", "255.255.255.255", "8.8.8.8"])
+    def test_a_record_validation(self, ip):
         """Test validation of A records (IPv4 addresses)."""
-        # Valid IPv4 addresses
-        valid_ips = ["192.168.1.1", "127.0.0.1", "0.0.0.0", "255.255.255.255", "8.8.8.8"]
-
-        for ip in valid_ips:
-            record = Record(id="", type="A", name="test", value=ip)
-            assert record.value == ip
-            # Verify it's a valid IPv4 address by parsing with ipaddress module
-            assert ipaddress.IPv4Address(ip)
-
-        # Invalid IPv4 addresses
-        invalid_ips = [
+        record = Record(id="", type="A", name="test", value=ip)
+        assert record.value == ip
+        # Verify it's a valid IPv4 address by parsing with ipaddress module
+        assert ipaddress.IPv4Address(ip)
+
+    @pytest.mark.parametrize(
+        "ip",
+        [
             "256.0.0.1",  # Out of range
             "192.168.1",  # Missing octet
             "192.168.1.1.5",  # Too many octets
             "192.168.1.a",  # Non-numeric
             "2001:db8::1",  # IPv6 address
             "not-an-ip",
-        ]
-
-        for ip in invalid_ips:
-            with pytest.raises(ValueError, match="Invalid IPv4 address for A record"):
-                Record(id="", type="A", name="test", value=ip)
-
-    def test_aaaa_record_validation(self):
-        """Test validation of AAAA records (IPv6 addresses)."""
-        # Valid IPv6 addresses
-        valid_ips = [
+        ],
+    )
+    def test_a_record_validation_rejects(self, ip):
+        """Test that invalid IPv4 addresses are rejected for A records."""
+        with pytest.raises(ValueError, match="Invalid IPv4 address for A record"):
+            Record(id="", type="A", name="test", value=ip)
+
+    @pytest.mark.parametrize(
+        "ip",
+        [
             "2001:db8::1",
             "::1",
             "::",
             "2001:0db8:0000:0000:0000:0000:0000:0001",
             "2001:db8::1:0:0:1",
             "fe80::1ff:fe23:4567:890a",
-        ]
-
-        for ip in valid_ips:
-            record = Record(id="", type="AAAA", name="test", value=ip)
-            assert record.value == ip
-            # Verify it's a valid IPv6 address by parsing with ipaddress module
-            assert ipaddress.IPv6Address(ip)
-
-        # Invalid IPv6 addresses
-        invalid_ips = [
+        ],
+    )
+    def test_aaaa_record_validation(self, ip):
+        """Test validation of AAAA records (IPv6 addresses)."""
+        record = Record(id="", type="AAAA", name="test", value=ip)
+        assert record.value == ip
+        # Verify it's a valid IPv6 address by parsing with ipaddress module
+        assert ipaddress.IPv6Address(ip)
+
+    @pytest.mark.parametrize(
+        "ip",
+        [
             "2001:db8::1::2",  # Multiple :: segments
             "2001:db8:g::1",  # Invalid hex
             "192.168.1.1",  # IPv4 address
             "not-an-ip",
             "2001:db8::1::",  # Trailing ::
             "::db8::1",  # Multiple :: segments
-        ]
-
-        for ip in invalid_ips:
-            with pytest.raises(ValueError, match="Invalid IPv6 address for AAAA record"):
-                Record(id="", type="AAAA", name="test", value=ip)
-
-    def test_mx_record_validation(self):
-        """Test validation of MX records."""
-        # Valid MX records
-        valid_mx = [
+        ],
+    )
+    def test_aaaa_record_validation_rejects(self, ip):
+        """Test that invalid IPv6 addresses are rejected for AAAA records."""
+        with pytest.raises(ValueError, match="Invalid IPv6 address for AAAA record"):
+            Record(id="", type="AAAA", name="test", value=ip)
+
+    @pytest.mark.parametrize(
+        "mx",
+        [
             "10 mail.example.com",
             "0 mail.example.com.",
             "5 mail.example.com",
             "65535 mail.example.com",
             "1 mail-server",
-        ]
-
-        for mx in valid_mx:
-            record = Record(id="", type="MX", name="test", value=mx)
-            assert record.value == mx
+        ],
+    )
+    def test_mx_record_validation(self, mx):
+        """Test validation of MX records."""
+        record = Record(id="", type="MX", name="test", value=mx)
+        assert record.value == mx
 
-        # Invalid MX records
-        invalid_mx = [
+    @pytest.mark.parametrize(
+        "mx",
+        [
             "mail.example.com",  # Missing priority
             "mail.example.com 10",  # Reversed format
             "-5 mail.example.com",  # Negative priority
@@ -188,38 +192,41 @@ class TestRecordValidation:
             "TEN mail.example.com",  # Non-numeric priority
             "10  ",  # Missing hostname with space
             "10 mail.example.com 20",  # Extra value
-        ]
-
-        for mx in invalid_mx:
-            with pytest.raises(ValueError):
-                Record(id="", type="MX", name="test", value=mx)
-
-    def test_txt_record_validation(self):
-        """Test validation of TXT records."""
-        # Valid TXT records
-        valid_txt = [
+        ],
+    )
+    def test_mx_record_validation_rejects(self, mx):
+        """Test that malformed MX values are rejected."""
+        with pytest.raises(ValueError):
+            Record(id="", type="MX", name="test", value=mx)
+
+    @pytest.mark.parametrize(
+        "txt",
+        [
             '"This is a TXT record"',
             '"v=spf1 include:_spf.example.com ~all"',
             '"This is a" "multi-part TXT record"',
             '"Contains \\"escaped\\" quotes"',
-        ]
-
-        for txt in valid_txt:
-            record = Record(id="", type="TXT", name="test", value=txt)
-            assert record.value == txt
+        ],
+    )
+    def test_txt_record_validation(self, txt):
+        """Test validation of TXT records."""
+        record = Record(id="", type="TXT", name="test", value=txt)
+        assert record.value == txt
 
-        # Invalid TXT records
-        invalid_txt = [
+    @pytest.mark.parametrize(
+        "txt",
+        [
             "This is not quoted",
             'No end quote"',
             '"No start quote',
             '"',  # Single quote
             "",  # Empty value
-        ]
-
-        for txt in invalid_txt:
-            with pytest.raises(ValueError):
-                Record(id="", type="TXT", name="test", value=txt)
+        ],
+    )
+    def test_txt_record_validation_rejects(self, txt):
+        """Test that unquoted or malformed TXT values are rejected."""
+        with pytest.raises(ValueError):
+            Record(id="", type="TXT", name="test", value=txt)
 
     def test_soa_record_validation(self):
         """Test validation of SOA records."""
@@ -242,10 +249,9 @@ class TestRecordValidation:
             with pytest.raises(ValueError):
                 Record(id="", type="SOA", name="@", value=soa)
 
-    def test_cname_record_validation(self):
-        """Test validation of CNAME records."""
-        # Valid CNAME targets
-        valid_cnames = [
+    @pytest.mark.parametrize(
+        "cname",
+        [
             "example.com",
             "example.com.",  # With trailing dot
             "sub.example.com",
@@ -253,25 +259,28 @@ class TestRecordValidation:
             "sub.domain.example.com.",
             "a-valid-hostname",
             "host123",
-        ]
-
-        for cname in valid_cnames:
-            record = Record(id="", type="CNAME", name="test", value=cname)
-            assert record.value == cname
+        ],
+    )
+    def test_cname_record_validation(self, cname):
+        """Test validation of CNAME records."""
+        record = Record(id="", type="CNAME", name="test", value=cname)
+        assert record.value == cname
 
-        # Invalid CNAME targets
-        invalid_cnames = [
+    @pytest.mark.parametrize(
+        "cname",
+        [
             "",  # Empty value
             "invalid.host.name$",  # Invalid characters
             "domain.with-trailing-hyphen-.",  # Trailing hyphen in label
             "-domain.with-leading-hyphen",  # Leading hyphen in label
             # Label too long (>63 chars)
             "a" * 64 + ".example.com",
-        ]
-
-        for cname in invalid_cnames:
-            with pytest.raises(ValueError):
-                Record(id="", type="CNAME", name="test", value=cname)
+        ],
+    )
+    def test_cname_record_validation_rejects(self, cname):
+        """Test that invalid CNAME targets are rejected."""
+        with pytest.raises(ValueError):
+            Record(id="", type="CNAME", name="test", value=cname)
 
     def _get_sample_value_for_type(self, record_type):
         """Helper method to get valid test values for each record type."""
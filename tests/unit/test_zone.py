@@ -50,6 +50,7 @@ class TestZoneValidation:
             "example-with-hyphens.com",
             "123numeric.com",
             "xn--bcher-kva.tld",  # IDN domain (bücher.tld)
+            "sub.xn--p1ai",  # Punycode TLD (.рф)
             "single-label.tld",
             "multi.label.domain.tld",
             "domain.co.uk",  # Multi-part TLD
@@ -85,6 +86,8 @@ class TestZoneValidation:
             "example..com",
             # Trailing dot (FQDN notation) - actually invalid for Hetzner zones
             "example.com.",
+            # Bare Punycode prefix is not a TLD (ends with hyphen)
+            "example.xn--",
         ]
 
         for name in invalid_names:
@@ -109,6 +112,18 @@ class TestZoneValidation:
         with pytest.raises(ValueError, match="Records must be a list"):
             Zone(id="a1b2c3d4e5f6g7h8i9j0k1", name="example.com", records="not-a-list")  # type: ignore
 
+        # Tuples and generators are accepted and normalized to a list
+        records = (
+            Record(id="0123456789abcdef0123456789abcdef", type="A", name="test", value="192.168.1.1"),
+            Record(id="0123456789abcdef0123456789abcdef", type="AAAA", name="test", value="2001:db8::1"),
+        )
+        zone = Zone(id="a1b2c3d4e5f6g7h8i9j0k1", name="example.com", records=records)  # type: ignore
+        assert isinstance(zone.records, list)
+        assert len(zone.records) == 2
+
+        zone = Zone(id="a1b2c3d4e5f6g7h8i9j0k1", name="example.com", records=(r for r in records))  # type: ignore
+        assert len(zone.records) == 2
+
     def test_duplicate_records_detection(self):
         """Test that duplicate records are rejected."""
         # Create records with same type, name, and value
@@ -145,6 +160,40 @@ class TestZoneValidation:
         zone = Zone(id="a1b2c3d4e5f6g7h8i9j0k1", name="example.com", records=records)
         assert len(zone.records) == 2
 
+    def test_add_record(self):
+        """Test that incremental insertion keeps records sorted and rejects duplicates."""
+        records = [
+            Record(id="", type="MX", name="@", value="10 mail.example.com"),
+        ]
+        zone = Zone(id="a1b2c3d4e5f6g7h8i9j0k1", name="example.com", records=records)
+
+        zone.add_record(Record(id="", type="A", name="www", value="192.168.1.1"))
+        zone.add_record(Record(id="", type="A", name="test", value="192.168.1.2"))
+
+        # Records are kept in (type, name) order
+        assert [(r.type, r.name) for r in zone.records] == [("A", "test"), ("A", "www"), ("MX", "@")]
+
+        # Duplicates are rejected, also against records passed to the constructor
+        with pytest.raises(ValueError, match="Duplicate record found"):
+            zone.add_record(Record(id="", type="A", name="www", value="192.168.1.1"))
+        with pytest.raises(ValueError, match="Duplicate record found"):
+            zone.add_record(Record(id="", type="MX", name="@", value="10 mail.example.com"))
+
+    def test_remove_records(self):
+        """Test that removal by record ID also clears the duplicate tracking."""
+        records = [
+            Record(id="0123456789abcdef0123456789abcdef", type="A", name="test", value="192.168.1.1"),
+            Record(id="fedcba9876543210fedcba9876543210", type="A", name="www", value="192.168.1.2"),
+        ]
+        zone = Zone(id="a1b2c3d4e5f6g7h8i9j0k1", name="example.com", records=records)
+
+        zone.remove_records(["0123456789abcdef0123456789abcdef"])
+        assert [(r.type, r.name) for r in zone.records] == [("A", "www")]
+
+        # A removed record no longer counts as a duplicate and can be re-added
+        zone.add_record(Record(id="", type="A", name="test", value="192.168.1.1"))
+        assert len(zone.records) == 2
+
     def test_records_sorting(self):
         """Test that records are sorted by type and then name."""
         # Create records in random order